@@ -1,12 +1,333 @@
 #!/usr/bin/env python3
 
 import csv
+import gc
 import sys
-from collections import defaultdict, deque
+from array import array
+from collections import defaultdict
+from contextlib import contextmanager
+from itertools import starmap
+from multiprocessing import Pool
+
+# Tapes are bytes of symbol ids. The unbounded blank runs on either side
+# are not stored: the head may sit before index 0 or past the end, where every
+# cell reads as BLANK.
+BLANK = 0  # Symbol id of the blank "_"
+SYMBOL_SLOTS = 256  # Tape cells are bytes, so at most 256 symbols
+SYMBOL_CELLS = [bytes((symbol,)) for symbol in range(SYMBOL_SLOTS)]  # Prebuilt one-cell tapes
+BLANK_CELL = SYMBOL_CELLS[BLANK]
+PARALLEL_THRESHOLD = 2048  # Smallest BFS level worth shipping to worker processes
+MOVES = {"L": -1, "R": 1, "S": 0}  # Head offset per direction; anything else also stays put
+
+
+@contextmanager
+def _gc_paused():
+    """Suspend the cyclic garbage collector for the duration of a search.
+
+    A search allocates configuration tuples by the million and keeps most
+    of them alive in its seen set, so the collector keeps triggering and
+    rescanning them without ever finding garbage: configurations, tapes
+    and parent links never form cycles, and reference counting alone frees
+    abandoned branches.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _intern_config(tape_pool, tape, head, state):
+    """Return the configuration as a (tape, head, state) tuple.
+
+    The tape is frozen to bytes and hash-consed through tape_pool, so equal
+    tapes across the search share one object. The tuple doubles as the
+    configuration's key in the seen set.
+    """
+    tape = bytes(tape)
+    return (tape_pool.setdefault(tape, tape), head, state)
+
+
+def _write(tape, head, symbol):
+    """Return (new_tape, new_head) after writing symbol under the head.
+
+    Writing past either end fills the gap with blanks; a blank written at
+    an end is trimmed off so the outer blank runs stay implicit. The tape is
+    returned as-is when the write changes nothing.
+    """
+    size = len(tape)
+
+    if 0 <= head < size:
+        if symbol != BLANK:
+            return tape[:head] + SYMBOL_CELLS[symbol] + tape[head + 1:], head
+        if head == size - 1:
+            return tape[:head].rstrip(BLANK_CELL), head
+        if head == 0:
+            trimmed = tape[1:].lstrip(BLANK_CELL)
+            return trimmed, head - (size - len(trimmed))
+        return tape[:head] + BLANK_CELL + tape[head + 1:], head
+
+    if symbol == BLANK:
+        return tape, head
+    if not size:
+        return SYMBOL_CELLS[symbol], 0
+    if head < 0:
+        return SYMBOL_CELLS[symbol] + BLANK_CELL * (-head - 1) + tape, 0
+    return tape + BLANK_CELL * (head - size) + SYMBOL_CELLS[symbol], head
+
+
+def _successors_source(transition_table, pairs):
+    """Generate the source of a step function for each (state, symbol) pair in pairs.
+
+    Returns a list indexed like the dense transition arrays, holding None
+    for pairs without transitions. Each source defines step(tape, head),
+    returning every (tape, head, state) reachable in one step, with every
+    new state, written symbol and move as a literal. A write of the symbol
+    already under the head skips _write and reuses the tape, and each
+    distinct written symbol is computed once per step.
+    """
+    trans_start, trans_end, trans_new_state, trans_write, trans_dir = transition_table
+    sources = [None] * len(trans_start)
+
+    for state, symbol in pairs:
+        key = state * SYMBOL_SLOTS + symbol
+        lines = ["def step(tape, head):"]
+        children = []
+        written = set()
+        for i in range(trans_start[key], trans_end[key]):
+            write_symbol, move = trans_write[i], trans_dir[i]
+            if write_symbol == symbol:
+                new_tape, new_head = "tape", "head"
+            else:
+                new_tape, new_head = f"tape_{write_symbol}", f"head_{write_symbol}"
+                if write_symbol not in written:
+                    written.add(write_symbol)
+                    lines.append(f"    {new_tape}, {new_head} = _write(tape, head, {write_symbol})")
+            if move:
+                new_head = f"{new_head} {'+' if move > 0 else '-'} {abs(move)}"
+            children.append(f"({new_tape}, {new_head}, {trans_new_state[i]})")
+        lines.append(f"    return [{', '.join(children)}]")
+        sources[key] = "\n".join(lines) + "\n"
+
+    return sources
+
+
+def _stuck(tape, head):
+    """Step function of a (state, symbol) pair without transitions."""
+    return []
+
+
+def _compile_successors(sources):
+    """Build successors(tape, head, state) from the step sources of _successors_source.
+
+    successors dispatches through a list of step functions indexed like the
+    dense transition arrays. Each step is compiled the first time its pair
+    is reached, so a large machine only pays for the pairs a search uses.
+    """
+    steps = [_stuck] * len(sources)
+
+    def compile_on_first_use(key):
+        def first_step(tape, head):
+            namespace = {"_write": _write}
+            exec(compile(sources[key], f"<step {key}>", "exec"), namespace)
+            steps[key] = namespace["step"]
+            return steps[key](tape, head)
+        return first_step
+
+    for key, source in enumerate(sources):
+        if source is not None:
+            steps[key] = compile_on_first_use(key)
+
+    def successors(tape, head, state, steps=steps):
+        return steps[state * SYMBOL_SLOTS + (tape[head] if 0 <= head < len(tape) else BLANK)](tape, head)
+
+    return successors
+
+
+_worker_successors_fn = None  # Compiled successors of a worker process, set by _init_worker
+
+
+def _init_worker(successors_source):
+    """Compile the machine's successors once per worker instead of once per task."""
+    global _worker_successors_fn
+    _worker_successors_fn = _compile_successors(successors_source)
+
+
+def _worker_successors(config):
+    """Pool task: the successors of one configuration."""
+    return _worker_successors_fn(*config)
+
+
+def _expand_level(frontier, successors, accept_state, reject_state, seen, tape_pool, budget, pool=None):
+    """Expand one BFS level in order, using at most budget transitions.
+
+    frontier is a list of (config, parent_node) nodes. New configurations
+    are added to seen; non-rejecting ones form next_frontier. pool, if given,
+    expands levels of at least PARALLEL_THRESHOLD. Returns (next_frontier,
+    looped, transitions_used, halt): looped is True if a non-rejecting child
+    was dropped as already seen, and halt is "accept", "limit" (budget ran
+    out) or None.
+    """
+    next_frontier = []
+
+    # Gather the level; every configuration before the first accepting one costs a transition
+    level_configs = [node[0] for node in frontier]
+    states = [config[2] for config in level_configs]
+    if accept_state in states:
+        cut = states.index(accept_state)
+        return next_frontier, False, min(cut, budget + 1), "limit" if cut > budget else "accept"
+    if len(level_configs) > budget:
+        return next_frontier, False, budget + 1, "limit"
+
+    if pool is not None and len(level_configs) >= PARALLEL_THRESHOLD:
+        expanded = pool.map(_worker_successors, level_configs)
+    else:
+        expanded = starmap(successors, level_configs)
+
+    # Bound methods, so the loop below does no attribute lookups
+    intern = tape_pool.setdefault
+    seen_add = seen.add
+    frontier_append = next_frontier.append
+    looped = False
+
+    for node, (tape, head, _), children in zip(frontier, level_configs, expanded):
+        if not children:
+            # No valid transitions, move to reject state
+            children = [(tape, head, reject_state)]
+
+        # Identical configurations have identical subtrees, so expand each only once.
+        # Child tapes are already bytes, so interning is a single setdefault.
+        for new_tape, new_head, new_state in children:
+            child = (intern(new_tape, new_tape), new_head, new_state)
+            if child in seen:
+                # A repeated live configuration means this branch loops or merges into another
+                looped = looped or new_state != reject_state
+                continue
+            seen_add(child)
+            if new_state != reject_state:
+                frontier_append((child, node))
+
+    return next_frontier, looped, len(level_configs), None
+
+
+def _longest_rejecting_path(successors, initial_config, reject_state):
+    """Return the length of the longest path from initial_config into the reject state.
+
+    Returns None if a cycle is reachable instead. Only meaningful once a
+    search has reached every configuration without accepting, so the
+    reachable configurations are finite and none of them accepts.
+    """
+    if initial_config[2] == reject_state:
+        return 0
+
+    def children(config):
+        return successors(*config) or [(config[0], config[1], reject_state)]
+
+    longest = {initial_config: None}  # Configuration -> longest path to a rejection; None while on the stack
+    initial_children = children(initial_config)
+    stack = [(initial_config, initial_children, iter(initial_children))]
+    while stack:
+        config, config_children, pending = stack[-1]
+        for child in pending:
+            if child[2] == reject_state:
+                continue
+            if child in longest:
+                if longest[child] is None:
+                    return None
+                continue
+            longest[child] = None
+            grandchildren = children(child)
+            stack.append((child, grandchildren, iter(grandchildren)))
+            break
+        else:
+            stack.pop()
+            longest[config] = 1 + max(0 if child[2] == reject_state else longest[child] for child in config_children)
+    return longest[initial_config]
+
+
+def run_bfs(successors_source, start_state, accept_state, reject_state, input_tape, max_depth, max_transitions,
+            processes=1, successors=None):
+    """Breadth-first search over the configurations of an encoded machine.
+
+    Takes state ids, the step sources from _successors_source (or successors
+    already compiled from them) and the encoded input tape. Returns
+    (outcome, depth, accept_node, num_configs) where outcome is "accept",
+    "limit" (out of transitions), "depth" (max depth reached), "reject"
+    (every path rejected), "loop" (no accepting path, but some path cycles
+    forever) or "exhausted"; depth is the number of levels expanded, or the
+    longest rejecting path for "reject"; accept_node is the accepting
+    (config, parent_node) node or None; and num_configs counts the
+    configurations reached after the first.
+    """
+    tape_pool = {}  # Shared tape objects, see _intern_config
+    initial_config = _intern_config(tape_pool, input_tape, 0, start_state)
+    frontier = [(initial_config, None)] if start_state != reject_state else []  # Live (config, parent_node) nodes
+    depth = 0
+    seen = {initial_config}  # Configurations already reached
+    transitions = 0
+    looped = False  # Whether any live branch was dropped as a repeat
+
+    if successors is None:
+        successors = _compile_successors(successors_source)
+    pool = Pool(processes, initializer=_init_worker, initargs=(successors_source,)) if processes > 1 else None
+    try:
+        with _gc_paused():
+            while transitions < max_transitions:
+                next_frontier, level_looped, used, halt = _expand_level(
+                    frontier, successors, accept_state, reject_state, seen, tape_pool,
+                    max_transitions - transitions, pool)
+                transitions += used
+
+                if halt == "accept":
+                    accept_node = next(node for node in frontier if node[0][2] == accept_state)
+                    return halt, depth, accept_node, len(seen) - 1
+                if halt is not None:
+                    return halt, depth, None, len(seen) - 1
+
+                # Advance to the new level; a level that was expanded counts even if all its children repeat
+                if frontier:
+                    depth += 1
+                frontier = next_frontier
+                looped = looped or level_looped
+
+                # Stop if max depth reached
+                if depth >= max_depth:
+                    return "depth", depth, None, len(seen) - 1
+
+                # Stop if all paths are rejecting. Branches dropped as repeats were cut short,
+                # so then measure the longest path, or find the cycle, over everything reached.
+                if not frontier:
+                    if looped:
+                        longest = _longest_rejecting_path(successors, initial_config, reject_state)
+                        if longest is None:
+                            return "loop", depth, None, len(seen) - 1
+                        if longest >= max_depth:
+                            return "depth", max_depth, None, len(seen) - 1
+                        depth = longest
+                    return "reject", depth, None, len(seen) - 1
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+    return "exhausted", depth, None, len(seen) - 1
+
 
 class NondeterministicTuringMachine:
     def __init__(self, filename):
-        self.transitions = defaultdict(list)  # Transitions will map (state, symbol) -> [(new_state, write_symbol, direction)]
+        self.transitions = defaultdict(list)  # Transitions will map (state_id, symbol_id) -> [(new_state_id, write_symbol_id, move)]
+        self.symbols = []  # symbol_id -> symbol
+        self.sym_id = {}  # symbol -> symbol_id
+        self.state_names = []  # state_id -> state
+        self.state_id = {}  # state -> state_id
+        self.trans_start = array("i")  # state_id * SYMBOL_SLOTS + symbol_id -> start of its slice below
+        self.trans_end = array("i")  # ... and end of that slice
+        self.trans_new_state = array("i")
+        self.trans_write = array("i")
+        self.trans_dir = array("b")
+        self.successors_source = []  # Generated by load_machine, see _successors_source
+        self.successors = None
         self.states = set()
         self.sigma = set()
         self.gamma = set()
@@ -19,118 +340,213 @@ class NondeterministicTuringMachine:
     
     def load_machine(self, filename):
         """Load NTM definition from a .csv file."""
+        # Intern symbols and states to small ints as they are read; the blank is always symbol 0
+        self.sym_id = {"_": BLANK}
+        self.state_id = {}
+
+        def symbol_id(symbol):
+            return self.sym_id.setdefault(symbol, len(self.sym_id))
+
+        def state_id(state):
+            return self.state_id.setdefault(state, len(self.state_id))
+
+        # Stream the file in one pass: seven header rows, then one transition per row
         with open(filename, mode="r") as file:
             reader = csv.reader(file)
-            rows = list(reader)
-        
-        self.name = rows[0][0]
-        self.states = set(rows[1])
-        self.sigma = set(rows[2])
-        self.gamma = set(rows[3])
-        self.start_state = rows[4][0]
-        self.accept_state = rows[5][0]
-        self.reject_state = rows[6][0]
-        
-        for transition in rows[7:]:
-            current_state, read_symbol, new_state, write_symbol, direction = transition
-            self.transitions[(current_state, read_symbol)].append((new_state, write_symbol, direction))
-
-    def run(self, input_string, max_depth=100, max_transitions=1000):
-        """Simulate the NTM with a breadth-first approach."""
+            self.name = next(reader)[0]
+            self.states = set(next(reader))
+            self.sigma = set(next(reader))
+            self.gamma = set(next(reader))
+            self.start_state = next(reader)[0]
+            self.accept_state = next(reader)[0]
+            self.reject_state = next(reader)[0]
+            for state in sorted(self.states | {self.start_state, self.accept_state, self.reject_state}):
+                state_id(state)
+            for symbol in sorted(self.sigma | self.gamma):
+                symbol_id(symbol)
+
+            for current_state, read_symbol, new_state, write_symbol, direction in reader:
+                self.transitions[(state_id(current_state), symbol_id(read_symbol))].append(
+                    (state_id(new_state), symbol_id(write_symbol), MOVES.get(direction, 0)))
+
+        self.symbols = list(self.sym_id)
+        self.state_names = list(self.state_id)
+        if len(self.symbols) > SYMBOL_SLOTS:
+            raise ValueError(f"{self.name} uses {len(self.symbols)} tape symbols; at most {SYMBOL_SLOTS} are supported.")
+
+        # Flatten the choices for each (state, symbol) into one contiguous slice, indexed
+        # densely; pairs without transitions keep the empty slice (0, 0)
+        slots = len(self.state_names) * SYMBOL_SLOTS
+        self.trans_start = array("i", [0]) * slots
+        self.trans_end = array("i", [0]) * slots
+        for (state, symbol), choices in self.transitions.items():
+            key = state * SYMBOL_SLOTS + symbol
+            self.trans_start[key] = len(self.trans_new_state)
+            for new_state, write_symbol, move in choices:
+                self.trans_new_state.append(new_state)
+                self.trans_write.append(write_symbol)
+                self.trans_dir.append(move)
+            self.trans_end[key] = len(self.trans_new_state)
+
+        # The transitions never change after loading, so specialize the step function to them
+        self.successors_source = _successors_source(self._transition_table(), self.transitions)
+        self.successors = _compile_successors(self.successors_source)
+
+    def _transition_table(self):
+        """Bundle the struct-of-arrays transition table for the search kernels."""
+        return (self.trans_start, self.trans_end, self.trans_new_state, self.trans_write, self.trans_dir)
+
+    def _encode_input(self, input_string):
+        """Convert the input string to a bytearray of symbol ids.
+
+        Returns (tape, symbols) where symbols maps ids back to symbols for
+        this run. Symbols outside the machine's alphabet have no transitions
+        but still need an id; theirs last only for the run, so the machine
+        itself is left unchanged.
+        """
+        sym_id = dict(self.sym_id)
+        for symbol in input_string:
+            sym_id.setdefault(symbol, len(sym_id))
+        if len(sym_id) > SYMBOL_SLOTS:
+            raise ValueError(f"{self.name} with this input uses {len(sym_id)} tape symbols; "
+                             f"at most {SYMBOL_SLOTS} are supported.")
+        return bytearray(map(sym_id.__getitem__, input_string)), list(sym_id)
+
+    def _decode(self, tape, head, state, symbols):
+        """Translate an encoded configuration back to [left_tape, state, right_tape] strings.
+
+        The head sits on the first symbol of right_tape. Implicit blanks are
+        shown only between the stored tape and the head.
+        """
+        symbol = symbols.__getitem__
+        left_tape = "".join(map(symbol, tape[:max(head, 0)])) + "_" * (head - len(tape))
+        right_tape = "_" * -head + "".join(map(symbol, tape[max(head, 0):])) or "_"
+        return [left_tape, self.state_names[state], right_tape]
+
+    def run(self, input_string, max_depth=100, max_transitions=1000, processes=1):
+        """Simulate the NTM with a breadth-first approach.
+
+        With processes > 1, wide levels are expanded by a pool of that many
+        worker processes.
+        """
         self.max_depth = max_depth
         self.max_transitions = max_transitions
 
-        initial_config = ["", self.start_state, input_string]  # [left_tape, state, right_tape]
-        tree = [[initial_config]]  # Tree of configurations
+        input_tape, symbols = self._encode_input(input_string)
+        outcome, depth, accept_node, num_configs = run_bfs(
+            self.successors_source, self.state_id[self.start_state], self.state_id[self.accept_state],
+            self.state_id[self.reject_state], input_tape, max_depth, max_transitions, processes, self.successors)
+
+        if outcome == "accept":
+            # Trace the configurations that led to acceptance
+            self.print_accept_path(accept_node, num_configs, symbols)
+        elif outcome == "limit":
+            print(f"Execution stopped after {self.max_transitions} transitions.")
+        elif outcome == "depth":
+            print(f"Execution stopped after reaching max depth of {self.max_depth}.")
+        elif outcome == "reject":
+            print(f"String rejected in {depth} transitions.")
+        elif outcome == "loop":
+            print("No accepting path found; at least one branch loops forever.")
+        else:
+            print(f"No valid paths found. Machine halted. configs explored: {depth + 1}")
+
+    def run_dfs(self, input_string, max_depth=100, max_transitions=1000):
+        """Simulate the NTM with a depth-first approach.
+
+        The stack holds every child pushed but not yet explored, and seen
+        holds every configuration reached with its shallowest depth, so memory
+        grows with the configurations reached, not with the depth. Like run,
+        each configuration is a (config, parent_node) node so the accept path
+        can be rebuilt.
+        """
+        self.max_depth = max_depth
+        self.max_transitions = max_transitions
+
+        accept_state = self.state_id[self.accept_state]
+        reject_state = self.state_id[self.reject_state]
+        successors = self.successors
+
+        tape_pool = {}
+        input_tape, symbols = self._encode_input(input_string)
+        initial_config = _intern_config(tape_pool, input_tape, 0, self.state_id[self.start_state])
+        stack = [((initial_config, None), 0)]  # [(node, depth)]
+        seen = {initial_config: 0}  # Configuration -> shallowest depth it was reached at
         transitions = 0
+        depth_reached = False
+        looped = False  # Whether any live branch was dropped as a repeat
 
-        while tree and transitions < self.max_transitions:
-            current_level = tree[-1]
-            next_level = []
+        # Locals for the loop below
+        max_depth, max_transitions = self.max_depth, self.max_transitions
+        intern = tape_pool.setdefault
+        push, pop = stack.append, stack.pop
 
-            for left_tape, state, right_tape in current_level:
-                if state == self.accept_state:
-                    # Trace and halt immediately upon acceptance
-                    self.print_accept_path(tree, len(tree) - 1)
+        with _gc_paused():
+            while stack:
+                node, depth = pop()
+                tape, head, state = node[0]
+
+                if state == accept_state:
+                    self.print_accept_path(node, len(seen) - 1, symbols)
                     return
 
-                if state == self.reject_state:
-                    continue  # Skip this branch if rejected
+                if state == reject_state:
+                    continue
 
-                # Read the symbol under the head
-                head_symbol = right_tape[0] if right_tape else "_"
                 transitions += 1
-
-                if transitions > self.max_transitions:
-                    print(f"Execution stopped after {self.max_transitions} transitions.")
+                if transitions > max_transitions:
+                    print(f"Execution stopped after {max_transitions} transitions.")
                     return
 
-                # Get transitions for the current state and head symbol
-                possible_transitions = self.transitions.get((state, head_symbol), [])
-
-                if not possible_transitions:
-                    # No valid transitions, move to reject state
-                    next_level.append([left_tape, self.reject_state, right_tape])
+                # Children past max depth are never explored, same as the BFS cutoff
+                if depth + 1 >= max_depth:
+                    depth_reached = True
                     continue
 
-                # Process valid transitions
-                for new_state, write_symbol, direction in possible_transitions:
-                    new_left_tape, new_right_tape = list(left_tape), list(right_tape)
-
-                    # Write symbol
-                    if new_right_tape:
-                        new_right_tape[0] = write_symbol
-                    else:
-                        new_right_tape.append(write_symbol)
-
-                    # Move head
-                    if direction == "L":
-                        if new_left_tape:
-                            new_right_tape.insert(0, new_left_tape.pop())
-                        else:
-                            new_right_tape.insert(0, "_")
-                    elif direction == "R":
-                        if new_right_tape:
-                            new_left_tape.append(new_right_tape.pop(0))
-                        if not new_right_tape:
-                            new_right_tape.append("_")
-
-                    # Add new configuration
-                    next_level.append(["".join(new_left_tape), new_state, "".join(new_right_tape)])
-
-
-            # Add valid configurations to the tree
-            if next_level:
-                tree.append(next_level)
-
-            # Stop if max depth reached
-            if len(tree) > self.max_depth:
-                print(f"Execution stopped after reaching max depth of {self.max_depth}.")
-                return
-
-            # Stop if all paths are rejecting
-            if not any(config[1] != self.reject_state for config in next_level):
-                print(f"String rejected in {len(tree) - 1} transitions.")
-                return
-
-        print(f"No valid paths found. Machine halted. configs explored: {len(tree)}")
-
-
-    def print_accept_path(self, tree, depth):
-        """Trace and print the path to the accept state."""
-        print(f"String accepted in {depth} transitions.")
-        num_configs = 0
-        for level in range(depth + 1):
-            for config in tree[level]:
-                num_configs+=1
-                print(f"Level {level}: {config}")
-        print(f'num_configs: {num_configs-1}')
+                # Push in reverse so the first listed transition is explored first
+                for new_tape, new_head, new_state in reversed(successors(tape, head, state)):
+                    child = (intern(new_tape, new_tape), new_head, new_state)
+                    # A configuration first reached deeper may have been cut off at max_depth,
+                    # so revisit it whenever a shorter path reaches it
+                    if seen.get(child, max_depth) <= depth + 1:
+                        looped = looped or new_state != reject_state
+                        continue
+                    seen[child] = depth + 1
+                    push(((child, node), depth + 1))
+
+        # Branches dropped as repeats were cut short; measure the longest path, or find the cycle
+        longest = 0
+        if looped and not depth_reached:
+            longest = _longest_rejecting_path(successors, initial_config, reject_state)
+        if depth_reached or (longest is not None and longest >= max_depth):
+            print(f"Execution stopped after reaching max depth of {self.max_depth}.")
+        elif longest is None:
+            print("No accepting path found; at least one branch loops forever.")
+        else:
+            print(f"String rejected after {transitions} transitions explored.")
+
+    def print_accept_path(self, node, num_configs, symbols):
+        """Trace and print the path to the accept state by walking parent links."""
+        path = []
+        while node is not None:
+            config, node = node
+            path.append(config)
+        path.reverse()
+
+        print(f"String accepted in {len(path) - 1} transitions.")
+        for level, config in enumerate(path):
+            print(f"Level {level}: {self._decode(*config, symbols)}")
+        print(f'num_configs: {num_configs}')
 
 if __name__ == "__main__":
     machine_file = input("Enter the Turing machine file name: ")
     input_string = input("Enter the input string: ")
     max_depth = int(input("Enter max depth (default 100): ") or 100)
     max_transitions = int(input("Enter max transitions (default 1000): ") or 1000)
+    search = input("Enter search strategy, bfs or dfs (default bfs): ").strip().lower() or "bfs"
 
     ntm = NondeterministicTuringMachine(machine_file)
-    ntm.run(input_string, max_depth, max_transitions)
+    if search == "dfs":
+        ntm.run_dfs(input_string, max_depth, max_transitions)
+    else:
+        ntm.run(input_string, max_depth, max_transitions)